@@ -0,0 +1,25 @@
+"""
+Default application settings
+"""
+
+from typing import Dict, Any
+
+SETTINGS: Dict[str, Any] = {
+    "log_format": "standard",
+    "anomaly_threshold": 2.0,
+    "error_rate_threshold": 10.0,
+    "chunk_size": 100,
+    "report_format": "json",
+    "openai": {
+        "enabled": True,
+        "model": "gpt-3.5-turbo",
+        "max_tokens": 500,
+        "temperature": 0.3,
+        "cache_dir": "~/.cache/ai-log-debugger",
+    },
+    "detection": {
+        "error_spike_enabled": True,
+        "pattern_anomaly_enabled": True,
+        "timing_anomaly_enabled": True,
+    },
+}
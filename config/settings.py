@@ -2,37 +2,51 @@
 Settings configuration
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Dict, Any, Optional
+import copy
+import json
 import os
 
+from config._defaults import SETTINGS as DEFAULT_SETTINGS_MUTABLE
+
 try:
     import yaml
 except ImportError:
     yaml = None
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+# Parsed YAML is cached next to the config file, keyed by its mtime and size
+CACHE_SUFFIX = ".cache.json"
+
+# Marks "not cached" in Settings.get so that cached None values still hit
+_SENTINEL = object()
+# Cached marker for dotted keys that do not resolve to a value
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert mappings back into plain dicts"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
 
 class Settings:
     """Application settings"""
 
-    # Default settings
-    DEFAULT_SETTINGS = {
-        "log_format": "standard",
-        "anomaly_threshold": 2.0,
-        "error_rate_threshold": 10.0,
-        "chunk_size": 100,
-        "report_format": "json",
-        "openai": {
-            "enabled": True,
-            "model": "gpt-3.5-turbo",
-            "max_tokens": 500,
-            "temperature": 0.3,
-        },
-        "detection": {
-            "error_spike_enabled": True,
-            "pattern_anomaly_enabled": True,
-            "timing_anomaly_enabled": True,
-        },
-    }
+    # Default settings (read-only; copied only when a config file is merged)
+    DEFAULT_SETTINGS = _freeze(DEFAULT_SETTINGS_MUTABLE)
 
     def __init__(self, config_file: Optional[str] = None):
         """
@@ -41,26 +55,70 @@ class Settings:
         Args:
             config_file: Path to YAML configuration file
         """
-        self.settings = self.DEFAULT_SETTINGS.copy()
+        self.settings: Mapping = self.DEFAULT_SETTINGS
+        self._cache: Dict[str, Any] = {}
         
-        if config_file and os.path.exists(config_file):
+        # A missing file is detected by the single stat in _load_from_file
+        if config_file:
             self._load_from_file(config_file)
 
     def _load_from_file(self, file_path: str) -> None:
-        """Load settings from YAML file"""
-        if yaml is None:
-            print("Warning: PyYAML not installed. Using default settings.")
-            return
-        
+        """Load settings from YAML file, using the JSON sidecar cache when fresh"""
         try:
-            with open(file_path, 'r') as f:
-                custom_settings = yaml.safe_load(f) or {}
-                self._merge_settings(custom_settings)
+            stat = os.stat(file_path)
+            cache_key = json.dumps([stat.st_mtime_ns, stat.st_size])
+            custom_settings = self._read_cache(file_path, cache_key)
+            if custom_settings is None:
+                if yaml is None:
+                    print("Warning: PyYAML not installed. Using default settings.")
+                    return
+
+                with open(file_path, 'r') as f:
+                    custom_settings = yaml.load(f, Loader=_YAML_LOADER) or {}
+                self._write_cache(file_path, cache_key, custom_settings)
+
+            self.settings = copy.deepcopy(DEFAULT_SETTINGS_MUTABLE)
+            self._merge_settings(custom_settings)
+        except FileNotFoundError:
+            return
         except Exception as e:
             print(f"Warning: Could not load config file {file_path}: {e}")
 
+    @staticmethod
+    def _read_cache(file_path: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return cached settings if the sidecar matches the config file's key"""
+        try:
+            with open(file_path + CACHE_SUFFIX, 'r') as f:
+                if f.readline().rstrip("\n") != cache_key:
+                    return None
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_cache(file_path: str, cache_key: str, custom: Dict[str, Any]) -> None:
+        """Atomically write parsed settings to the JSON sidecar (best effort)"""
+        cache_path = file_path + CACHE_SUFFIX
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            payload = json.dumps(custom)
+            # JSON turns non-string keys into strings; only cache data that
+            # reads back unchanged
+            if json.loads(payload) != custom:
+                return
+            with open(tmp_path, 'w') as f:
+                f.write(cache_key + "\n" + payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            # Unwritable directory or non-JSON YAML values: just skip caching
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def _merge_settings(self, custom: Dict[str, Any]) -> None:
         """Merge custom settings with defaults"""
+        self._cache.clear()
         for key, value in custom.items():
             if isinstance(value, dict) and key in self.settings:
                 self.settings[key].update(value)
@@ -69,17 +127,22 @@ class Settings:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value"""
-        keys = key.split(".")
-        value = self.settings
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        value = self._cache.get(key, _SENTINEL)
+        if value is _SENTINEL:
+            value = self.settings
+            for k in key.split("."):
+                if isinstance(value, Mapping) and k in value:
+                    value = value[k]
+                else:
+                    value = _MISSING
+                    break
+            self._cache[key] = value
+
+        if value is _MISSING:
+            return default
+        # Subtrees come back as plain dicts whether or not a file was loaded
+        return _thaw(value) if isinstance(value, Mapping) else value
 
     def to_dict(self) -> Dict[str, Any]:
         """Get all settings as dictionary"""
-        return self.settings.copy()
+        return _thaw(self.settings)
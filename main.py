@@ -2,17 +2,37 @@
 Main entry point for the AI-Powered Log Debugging Assistant
 """
 
+import os
 import sys
-import argparse
-from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, List
 
-from src.analyzer import LogAnalyzer
-from src.reporter import Reporter
 from config.settings import Settings
 
+if TYPE_CHECKING:
+    import argparse
+
+
+FORMAT_CHOICES = ("json", "html", "dict")
+DEFAULT_CONFIG = "config/settings.yaml"
+
+# Flags understood by the fast-path parser, mapped to (attribute, takes_value)
+_FLAGS = {
+    "-o": ("output", True),
+    "--output": ("output", True),
+    "-f": ("format", True),
+    "--format": ("format", True),
+    "-c": ("config", True),
+    "--config": ("config", True),
+    "-v": ("verbose", False),
+    "--verbose": ("verbose", False),
+}
+
+
+def build_arg_parser() -> "argparse.ArgumentParser":
+    """Build the full argparse parser (used for help and error reporting)"""
+    import argparse
 
-def main():
-    """Main application entry point"""
     parser = argparse.ArgumentParser(
         description="AI-Powered Log Debugging Assistant"
     )
@@ -30,7 +50,7 @@ def main():
     
     parser.add_argument(
         "-f", "--format",
-        choices=["json", "html", "dict"],
+        choices=FORMAT_CHOICES,
         default="json",
         help="Output format for the report"
     )
@@ -38,7 +58,7 @@ def main():
     parser.add_argument(
         "-c", "--config",
         help="Path to configuration file",
-        default="config/settings.yaml"
+        default=DEFAULT_CONFIG
     )
     
     parser.add_argument(
@@ -47,23 +67,76 @@ def main():
         help="Enable verbose output"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command-line arguments
+
+    Plain invocations are handled without constructing argparse; help
+    requests and anything unusual or invalid fall back to argparse so its
+    help text and error messages are reused.
+    """
+    args = SimpleNamespace(
+        logfile=None, output=None, format="json", config=DEFAULT_CONFIG, verbose=False
+    )
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith("-"):
+            name, sep, value = arg.partition("=")
+            flag = _FLAGS.get(name)
+            if flag is None:
+                return build_arg_parser().parse_args(argv)
+            attr, takes_value = flag
+            if not takes_value:
+                if sep:
+                    return build_arg_parser().parse_args(argv)
+                setattr(args, attr, True)
+            else:
+                if not sep:
+                    i += 1
+                    if i >= len(argv) or argv[i].startswith("-"):
+                        return build_arg_parser().parse_args(argv)
+                    value = argv[i]
+                setattr(args, attr, value)
+        elif args.logfile is None:
+            args.logfile = arg
+        else:
+            return build_arg_parser().parse_args(argv)
+        i += 1
+
+    if args.logfile is None or args.format not in FORMAT_CHOICES:
+        return build_arg_parser().parse_args(argv)
+
+    return args
+
+
+def main():
+    """Main application entry point"""
+    args = parse_args(sys.argv[1:])
     
     # Validate log file exists
-    if not Path(args.logfile).exists():
+    if not os.path.isfile(args.logfile):
         print(f"Error: Log file not found: {args.logfile}")
         sys.exit(1)
     
-    # Load settings
-    settings = Settings(config_file=args.config if Path(args.config).exists() else None)
+    # Load settings (a missing config file falls back to the defaults)
+    settings = Settings(config_file=args.config)
     
     if args.verbose:
         print(f"Loading configuration from: {args.config}")
         print(f"Analyzing log file: {args.logfile}")
         print(f"Output format: {args.format}")
     
+    # Deferred so that --help and argument errors skip the heavy imports
+    from src.analyzer import LogAnalyzer
+    from src.reporter import Reporter
+
     # Initialize analyzer
-    analyzer = LogAnalyzer(config_path=args.config)
+    analyzer = LogAnalyzer(config_path=args.config, settings=settings)
     
     # Perform analysis
     if args.verbose:
@@ -27,7 +27,7 @@ setup(
         "pandas>=2.0.3",
         "scikit-learn>=1.3.0",
         "scipy>=1.11.1",
-        "openai>=0.27.8",
+        "openai>=1.0.0",
         "requests>=2.31.0",
         "pyyaml>=6.0",
         "pydantic>=2.0.0",
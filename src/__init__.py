@@ -6,16 +6,38 @@ Package initialization
 __version__ = "0.1.0"
 __author__ = "Backend Engineer"
 
-from src.log_parser import LogParser
-from src.analyzer import LogAnalyzer
-from src.ai_engine import AIEngine
-from src.anomaly_detector import AnomalyDetector
-from src.reporter import Reporter
+from importlib import import_module
+
+# Public names are imported lazily (PEP 562) so that importing the package,
+# e.g. for CLI --help, does not pull in numpy, dotenv or openai.
+_LAZY_IMPORTS = {
+    "LogParser": "src.log_parser",
+    "LogEntries": "src.log_parser",
+    "LogAnalyzer": "src.analyzer",
+    "AIEngine": "src.ai_engine",
+    "AnomalyDetector": "src.anomaly_detector",
+    "Reporter": "src.reporter",
+}
 
 __all__ = [
     "LogParser",
+    "LogEntries",
     "LogAnalyzer",
     "AIEngine",
     "AnomalyDetector",
     "Reporter",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -3,34 +3,118 @@ AI Engine Module
 Leverages OpenAI API for intelligent log analysis and recommendations
 """
 
+import hashlib
+import json
 import os
+import re
+import tempfile
+from itertools import islice
 from typing import List, Dict, Any, Optional
-from dotenv import load_dotenv
+from config._defaults import SETTINGS as _DEFAULT_SETTINGS
 
-# Load environment variables
-load_dotenv()
+DEFAULT_CACHE_DIR = _DEFAULT_SETTINGS["openai"]["cache_dir"]
+
+# Heuristic suggestion templates
+_ERROR_SPIKE_TMPL = (
+    "Error Spike Detected (Severity: {severity}): "
+    "{affected} entries affected. "
+    "Action: Review error messages during this period, check system resources, "
+    "and verify external service dependencies."
+)
+_PATTERN_TMPL = (
+    "Pattern Anomaly (Severity: {severity}): "
+    "Message '{message}' appears in {percentage:.1f}% of logs. "
+    "Action: Investigate why this pattern is so prevalent or rare."
+)
+_TIMING_TMPL = (
+    "Timing Anomaly (Severity: {severity}): "
+    "Unusual gap of {gap:.2f}s detected in log entries. "
+    "Action: Check for service interruptions or batch processing delays."
+)
+
+# .env is read on first need rather than at import time
+_DOTENV_LOADED = False
+_openai_module = None
+
+
+def _load_env() -> None:
+    """Load environment variables from .env once per process"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def _get_openai():
+    """Import the openai package once and cache the module"""
+    global _openai_module
+    if _openai_module is None:
+        import openai
+
+        _openai_module = openai
+    return _openai_module
 
 
 class AIEngine:
     """AI-powered log analysis using OpenAI or fallback logic"""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    __slots__ = ("api_key", "model", "client", "cache_dir")
+
+    # Root-cause keyword categories, one capture group per entry in _ROOT_CAUSES
+    _CATEGORY_RE = re.compile(
+        r"(connection|timeout|refused)"
+        r"|(memory|heap)"
+        r"|(permission|denied|unauthorized)"
+        r"|(database|sql|query)",
+        re.IGNORECASE,
+    )
+    _ROOT_CAUSES = (
+        (
+            "Network connectivity or service availability issue",
+            "Check network connectivity and service status",
+        ),
+        (
+            "Memory exhaustion or memory leak",
+            "Increase heap size or investigate memory leak",
+        ),
+        (
+            "Authentication or authorization failure",
+            "Check user credentials and permissions",
+        ),
+        (
+            "Database query or connection issue",
+            "Check database connectivity and query syntax",
+        ),
+    )
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-3.5-turbo",
+        cache_dir: Optional[str] = None,
+    ):
         """
         Initialize AI engine
 
         Args:
             api_key: OpenAI API key (if None, loads from .env)
             model: Model to use for analysis
+            cache_dir: Directory for cached OpenAI responses
         """
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        if not api_key:
+            _load_env()
+            api_key = os.getenv("OPENAI_API_KEY", "")
+        self.api_key = api_key
         self.model = model
         self.client = None
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
 
         if self.api_key:
             try:
-                import openai
-
-                openai.api_key = self.api_key
+                # One client per engine so HTTP connections are kept alive
+                self.client = _get_openai().OpenAI(api_key=self.api_key)
             except ImportError:
                 print("Warning: openai package not installed. Using fallback mode.")
 
@@ -52,7 +136,7 @@ class AIEngine:
             }
 
         # Try to use OpenAI API, fall back to heuristic analysis
-        if self.api_key:
+        if self.client is not None:
             return self._ai_analysis_openai(anomalies)
         else:
             return self._ai_analysis_heuristic(anomalies)
@@ -70,20 +154,25 @@ class AIEngine:
         if not error_logs:
             return {"status": "success", "causes": [], "recommendations": []}
 
-        if self.api_key:
+        if self.client is not None:
             return self._root_cause_openai(error_logs)
         else:
             return self._root_cause_heuristic(error_logs)
 
     def _ai_analysis_openai(self, anomalies: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Use OpenAI to analyze anomalies"""
-        try:
-            import openai
+        cache_key = self._cache_key(
+            "analysis", json.dumps(anomalies, sort_keys=True, default=str)
+        )
+        cached = self._cache_read(cache_key)
+        if cached is not None:
+            return cached
 
+        try:
             # Prepare anomaly summary for analysis
             anomaly_text = self._format_anomalies(anomalies)
 
-            response = openai.ChatCompletion.create(
+            response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -101,35 +190,28 @@ class AIEngine:
 
             suggestion = response.choices[0].message.content
 
-            return {
+            result = {
                 "status": "success",
                 "method": "openai",
                 "suggestions": [suggestion],
                 "anomaly_count": len(anomalies),
             }
+            self._cache_write(cache_key, result)
+            return result
         except Exception as e:
             print(f"OpenAI analysis failed: {e}. Falling back to heuristic analysis.")
             return self._ai_analysis_heuristic(anomalies)
 
     def _ai_analysis_heuristic(self, anomalies: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Fallback heuristic-based analysis without OpenAI"""
-        suggestions = []
-
-        for anomaly in anomalies:
-            anomaly_type = anomaly.get("type", "unknown")
-            severity = anomaly.get("severity", "low")
-
-            if anomaly_type == "error_spike":
-                suggestion = self._suggest_error_spike_fix(anomaly, severity)
-                suggestions.append(suggestion)
-
-            elif anomaly_type == "pattern_anomaly":
-                suggestion = self._suggest_pattern_fix(anomaly, severity)
-                suggestions.append(suggestion)
-
-            elif anomaly_type == "timing_anomaly":
-                suggestion = self._suggest_timing_fix(anomaly, severity)
-                suggestions.append(suggestion)
+        # Resolve every builder up front, then build suggestions in one pass
+        get_suggester = self._SUGGESTERS.get
+        suggesters = [get_suggester(a.get("type", "unknown")) for a in anomalies]
+        suggestions = [
+            suggest(self, anomaly, anomaly.get("severity", "low"))
+            for suggest, anomaly in zip(suggesters, anomalies)
+            if suggest is not None
+        ]
 
         return {
             "status": "success",
@@ -140,12 +222,16 @@ class AIEngine:
 
     def _root_cause_openai(self, error_logs: List[str]) -> Dict[str, Any]:
         """Use OpenAI to determine root causes"""
-        try:
-            import openai
-
-            logs_text = "\n".join(error_logs[:10])  # Limit to first 10 logs
+        # First 10 logs, joined once for both the cache key and the prompt
+        prompt_body = "\n".join(islice(error_logs, 10))
+        cache_key = self._cache_key("root_cause", prompt_body)
+        cached = self._cache_read(cache_key)
+        if cached is not None:
+            cached["log_count"] = len(error_logs)
+            return cached
 
-            response = openai.ChatCompletion.create(
+        try:
+            response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -154,7 +240,7 @@ class AIEngine:
                     },
                     {
                         "role": "user",
-                        "content": f"What are the likely root causes of these errors?\n\n{logs_text}",
+                        "content": f"What are the likely root causes of these errors?\n\n{prompt_body}",
                     },
                 ],
                 max_tokens=400,
@@ -163,12 +249,14 @@ class AIEngine:
 
             analysis = response.choices[0].message.content
 
-            return {
+            result = {
                 "status": "success",
                 "method": "openai",
                 "analysis": analysis,
                 "log_count": len(error_logs),
             }
+            self._cache_write(cache_key, result)
+            return result
         except Exception as e:
             print(f"OpenAI root cause analysis failed: {e}")
             return self._root_cause_heuristic(error_logs)
@@ -178,24 +266,20 @@ class AIEngine:
         causes = []
         recommendations = []
 
-        error_text = " ".join(error_logs).lower()
-
-        # Check for common error patterns
-        if any(word in error_text for word in ["connection", "timeout", "refused"]):
-            causes.append("Network connectivity or service availability issue")
-            recommendations.append("Check network connectivity and service status")
-
-        if any(word in error_text for word in ["memory", "out of memory", "heap"]):
-            causes.append("Memory exhaustion or memory leak")
-            recommendations.append("Increase heap size or investigate memory leak")
-
-        if any(word in error_text for word in ["permission", "denied", "unauthorized"]):
-            causes.append("Authentication or authorization failure")
-            recommendations.append("Check user credentials and permissions")
-
-        if any(word in error_text for word in ["database", "sql", "query"]):
-            causes.append("Database query or connection issue")
-            recommendations.append("Check database connectivity and query syntax")
+        # Scan log by log (no joined copy); each capture group marks a
+        # category, and scanning stops once every category has matched
+        found = 0
+        all_found = (1 << len(self._ROOT_CAUSES)) - 1
+        for log in error_logs:
+            for match in self._CATEGORY_RE.finditer(log):
+                found |= 1 << (match.lastindex - 1)
+            if found == all_found:
+                break
+
+        for bit, (cause, recommendation) in enumerate(self._ROOT_CAUSES):
+            if found & (1 << bit):
+                causes.append(cause)
+                recommendations.append(recommendation)
 
         if not causes:
             causes.append("Requires detailed investigation")
@@ -211,31 +295,54 @@ class AIEngine:
     def _suggest_error_spike_fix(self, anomaly: Dict[str, Any], severity: str) -> str:
         """Generate suggestion for error spike"""
         affected = anomaly.get("affected_entries", 0)
-        return (
-            f"Error Spike Detected (Severity: {severity}): "
-            f"{affected} entries affected. "
-            f"Action: Review error messages during this period, check system resources, "
-            f"and verify external service dependencies."
-        )
+        return _ERROR_SPIKE_TMPL.format(severity=severity, affected=affected)
 
     def _suggest_pattern_fix(self, anomaly: Dict[str, Any], severity: str) -> str:
         """Generate suggestion for pattern anomaly"""
         message = anomaly.get("message", "Unknown")[:50]
         percentage = anomaly.get("percentage", 0)
-        return (
-            f"Pattern Anomaly (Severity: {severity}): "
-            f"Message '{message}' appears in {percentage:.1f}% of logs. "
-            f"Action: Investigate why this pattern is so prevalent or rare."
+        return _PATTERN_TMPL.format(
+            severity=severity, message=message, percentage=percentage
         )
 
     def _suggest_timing_fix(self, anomaly: Dict[str, Any], severity: str) -> str:
         """Generate suggestion for timing anomaly"""
         gap = anomaly.get("gap_duration", 0)
-        return (
-            f"Timing Anomaly (Severity: {severity}): "
-            f"Unusual gap of {gap:.2f}s detected in log entries. "
-            f"Action: Check for service interruptions or batch processing delays."
-        )
+        return _TIMING_TMPL.format(severity=severity, gap=gap)
+
+    def _cache_key(self, kind: str, payload: str) -> str:
+        """Hash the request inputs (and model) into a cache key"""
+        digest = hashlib.sha256(f"{kind}\0{self.model}\0{payload}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached OpenAI response, or None on a miss"""
+        try:
+            with open(os.path.join(self.cache_dir, f"{key}.json"), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _cache_write(self, key: str, result: Dict[str, Any]) -> None:
+        """Atomically store an OpenAI response (best effort)"""
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(result, f, default=str)
+            os.replace(tmp_path, os.path.join(self.cache_dir, f"{key}.json"))
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not cache OpenAI response: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    # Heuristic suggestion builders keyed by anomaly type
+    _SUGGESTERS = {
+        "error_spike": _suggest_error_spike_fix,
+        "pattern_anomaly": _suggest_pattern_fix,
+        "timing_anomaly": _suggest_timing_fix,
+    }
 
     def _format_anomalies(self, anomalies: List[Dict[str, Any]]) -> str:
         """Format anomalies for AI analysis"""
@@ -3,31 +3,58 @@ Main Analyzer Module
 Orchestrates log analysis workflow
 """
 
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from src.log_parser import LogParser, LogEntry
 from src.anomaly_detector import AnomalyDetector
 from src.ai_engine import AIEngine
 from src.reporter import Reporter
+from config.settings import Settings
+
+_ERROR_LEVELS = frozenset(("ERROR", "CRITICAL"))
 
 
 class LogAnalyzer:
     """Main analyzer orchestrating the log analysis pipeline"""
 
+    __slots__ = (
+        "parser",
+        "anomaly_detector",
+        "ai_engine",
+        "reporter",
+        "config_path",
+        "settings",
+        "logs",
+        "metrics",
+        "anomalies",
+    )
+
     def __init__(
         self,
         config_path: Optional[str] = None,
         openai_api_key: Optional[str] = None,
+        settings: Optional[Settings] = None,
     ):
         """
         Initialize LogAnalyzer
 
         Args:
-            config_path: Path to configuration file
+            config_path: Path to configuration file (used if settings is None)
             openai_api_key: OpenAI API key for AI analysis
+            settings: Preloaded settings to share with the caller
         """
+        if settings is None:
+            settings = Settings(config_file=config_path)
+        self.settings = settings
         self.parser = LogParser()
-        self.anomaly_detector = AnomalyDetector(threshold=2.0)
-        self.ai_engine = AIEngine(api_key=openai_api_key)
+        self.anomaly_detector = AnomalyDetector(
+            threshold=settings.get("anomaly_threshold", 2.0)
+        )
+        self.ai_engine = AIEngine(
+            api_key=openai_api_key,
+            model=settings.get("openai.model", "gpt-3.5-turbo"),
+            cache_dir=settings.get("openai.cache_dir"),
+        )
         self.reporter = Reporter()
         self.config_path = config_path
         self.logs: List[LogEntry] = []
@@ -49,11 +76,8 @@ class LogAnalyzer:
         if not self.logs:
             return {"status": "error", "message": f"No logs found in {file_path}"}
 
-        # Extract metrics
-        self.metrics = self.anomaly_detector.extract_metrics(self.logs)
-
-        # Detect anomalies
-        self.anomalies = self.anomaly_detector.detect_anomalies(self.logs)
+        # Extract metrics and detect anomalies (sharing one pass over the logs)
+        self.metrics, self.anomalies = self.anomaly_detector.analyze(self.logs)
 
         # Get AI suggestions
         ai_analysis = self.ai_engine.analyze_and_suggest(self.anomalies)
@@ -74,14 +98,15 @@ class LogAnalyzer:
         if not logs:
             return {}
 
-        from collections import Counter
+        # Collect all messages and error messages in a single pass
+        messages = []
+        errors = []
+        for log in logs:
+            messages.append(log.message)
+            if log.level in _ERROR_LEVELS:
+                errors.append(log.message)
 
-        # Get message patterns
-        messages = [log.message for log in logs]
         message_counter = Counter(messages)
-
-        # Get error patterns
-        errors = [log.message for log in logs if log.level in ["ERROR", "CRITICAL"]]
         error_counter = Counter(errors)
 
         return {
@@ -160,7 +185,7 @@ class LogAnalyzer:
         return {
             "metrics": self.metrics,
             "anomalies": self.anomalies,
-            "logs": [log.to_dict() for log in self.logs[:100]],  # First 100 logs
+            "logs": self.logs,  # Serialized (first 100) by the reporter on demand
         }
 
     def _generate_recommendations(self) -> List[str]:
@@ -3,10 +3,149 @@ Anomaly Detection Module
 Statistical methods for identifying unusual log patterns
 """
 
+import math
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from collections import Counter
-from src.log_parser import LogEntry
+from itertools import compress
+from src.log_parser import LogEntry, LogEntries
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Levels counted towards the error rate, and the subset treated as errors
+_ERROR_LEVELS = frozenset({"ERROR", "CRITICAL", "WARNING"})
+_HARD_ERRORS = frozenset({"ERROR", "CRITICAL"})
+
+# Below this many values, mean/std are computed in Python; NumPy's per-call
+# overhead outweighs the arithmetic for short arrays
+SMALL_STATS_N = 64
+
+# Detector methods accept row-wise LogEntry lists or columnar LogEntries
+Entries = Union[List[LogEntry], LogEntries]
+
+
+def _timestamps(entries: Entries) -> np.ndarray:
+    """Entry timestamps as a datetime64[us] array"""
+    if isinstance(entries, LogEntries):
+        return entries.timestamps
+    return np.fromiter(
+        (e.timestamp for e in entries), dtype="datetime64[us]", count=len(entries)
+    )
+
+
+def _messages(entries: Entries):
+    """Iterable over entry messages"""
+    if isinstance(entries, LogEntries):
+        return entries.messages
+    return (e.message for e in entries)
+
+
+def _level_mask(entries: Entries, levels: frozenset) -> np.ndarray:
+    """Boolean array marking entries whose level is in `levels`"""
+    if isinstance(entries, LogEntries):
+        return np.isin(entries.levels, entries.level_codes(levels))
+    return np.fromiter(
+        (e.level in levels for e in entries), dtype=bool, count=len(entries)
+    )
+
+
+def _timestamp_at(entries: Entries, index: int):
+    """Timestamp of one entry as a datetime"""
+    if isinstance(entries, LogEntries):
+        return entries.timestamps[index].item()
+    return entries[index].timestamp
+
+
+def _welford(values: List[float]) -> Tuple[float, float]:
+    """Mean and population standard deviation in a single stable pass"""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return mean, math.sqrt(m2 / n)
+
+
+def _mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """Mean and population standard deviation of a non-empty array"""
+    if len(values) < SMALL_STATS_N:
+        return _welford(values.tolist())
+    return float(values.mean()), float(values.std())
+
+
+def _top_k(counts: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k largest counts, in Counter.most_common(k) order
+
+    Ties keep their original order, matching most_common's stable sort.
+    """
+    if len(counts) > k:
+        kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+        above = np.flatnonzero(counts > kth)
+        tied = np.flatnonzero(counts == kth)[: k - len(above)]
+        candidates = np.sort(np.concatenate((above, tied)))
+    else:
+        candidates = np.arange(len(counts))
+    return candidates[np.argsort(-counts[candidates], kind="stable")]
+
+
+def _spike_kernel_loop(
+    is_error: np.ndarray, chunk_size: int, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-chunk error rates and the indices of chunks that spike
+
+    Written as plain loops so numba can compile it; see _spike_kernel_numpy
+    for the fallback used when numba is not installed.
+    """
+    n = is_error.shape[0]
+    n_chunks = (n + chunk_size - 1) // chunk_size
+    rates = np.empty(n_chunks, dtype=np.float64)
+    for c in range(n_chunks):
+        start = c * chunk_size
+        end = min(start + chunk_size, n)
+        count = 0
+        for i in range(start, end):
+            count += is_error[i]
+        rates[c] = (count / (end - start)) * 100
+
+    if n_chunks < 2:
+        return rates, np.empty(0, dtype=np.int64)
+
+    cutoff = rates.mean() + threshold * rates.std()
+    return rates, np.nonzero(rates > cutoff)[0]
+
+
+def _spike_kernel_numpy(
+    is_error: np.ndarray, chunk_size: int, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized equivalent of _spike_kernel_loop"""
+    n = len(is_error)
+    if n == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+
+    starts = np.arange(0, n, chunk_size)
+    counts = np.add.reduceat(is_error, starts, dtype=np.int64)
+    sizes = np.diff(np.append(starts, n))
+    rates = (counts / sizes) * 100
+
+    if len(rates) < 2:
+        return rates, np.empty(0, dtype=np.int64)
+
+    cutoff = rates.mean() + threshold * rates.std()
+    return rates, np.flatnonzero(rates > cutoff)
+
+
+if njit is not None:
+    _spike_kernel = njit(cache=True)(_spike_kernel_loop)
+else:
+    _spike_kernel = _spike_kernel_numpy
 
 
 class AnomalyDetector:
@@ -22,12 +161,12 @@ class AnomalyDetector:
         self.threshold = threshold
         self.baseline_stats = {}
 
-    def extract_metrics(self, entries: List[LogEntry]) -> Dict[str, Any]:
+    def extract_metrics(self, entries: Entries) -> Dict[str, Any]:
         """
         Extract statistical metrics from log entries
 
         Args:
-            entries: List of LogEntry objects
+            entries: List of LogEntry objects or columnar LogEntries
 
         Returns:
             Dictionary with extracted metrics
@@ -35,182 +174,269 @@ class AnomalyDetector:
         if not entries:
             return {}
 
-        metrics = {
-            "total_entries": len(entries),
-            "level_distribution": self._get_level_distribution(entries),
-            "error_rate": self._calculate_error_rate(entries),
-            "message_length_stats": self._get_message_length_stats(entries),
-            "time_gaps": self._calculate_time_gaps(entries),
-            "unique_messages": len(set(e.message for e in entries)),
-            "top_errors": self._get_top_errors(entries),
-        }
+        return self._metrics(entries, self._entry_data(entries))
 
-        return metrics
-
-    def detect_anomalies(self, entries: List[LogEntry]) -> List[Dict[str, Any]]:
+    def detect_anomalies(self, entries: Entries) -> List[Dict[str, Any]]:
         """
         Detect anomalies in log entries
 
         Args:
-            entries: List of LogEntry objects
+            entries: List of LogEntry objects or columnar LogEntries
 
         Returns:
             List of detected anomalies with details
         """
+        return self._anomalies(entries, {})
+
+    def analyze(self, entries: Entries) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Extract metrics and detect anomalies in one go
+
+        Per-entry data (level counts, message counts, error mask, time gaps)
+        is computed once and shared by both steps of this call.
+
+        Args:
+            entries: List of LogEntry objects or columnar LogEntries
+
+        Returns:
+            Tuple of (metrics, anomalies) as from extract_metrics and
+            detect_anomalies
+        """
+        if not entries:
+            return {}, self.detect_anomalies(entries)
+
+        data = self._entry_data(entries, with_mask=True)
+        return self._metrics(entries, data), self._anomalies(entries, data)
+
+    def _metrics(self, entries: Entries, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the metrics dictionary from per-entry data"""
+        level_counter = data["level_counter"]
+        error_count = sum(level_counter[level] for level in _ERROR_LEVELS)
+
+        metrics = {
+            "total_entries": len(entries),
+            "level_distribution": dict(level_counter),
+            "error_rate": (error_count / len(entries)) * 100,
+            "message_length_stats": self._get_message_length_stats(data["lengths"]),
+            "time_gaps": data["gaps"].tolist(),
+            "unique_messages": len(data["message_counter"]),
+            "top_errors": data["error_counter"].most_common(5),
+        }
+
+        return metrics
+
+    def _anomalies(
+        self, entries: Entries, data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Run every detector, reusing whatever per-entry data is given"""
         anomalies = []
 
         # Check for spike in errors
-        error_anomalies = self._detect_error_spikes(entries)
+        error_anomalies = self._detect_error_spikes(entries, data.get("is_error"))
         anomalies.extend(error_anomalies)
 
         # Check for unusual message patterns
-        pattern_anomalies = self._detect_pattern_anomalies(entries)
+        pattern_anomalies = self._detect_pattern_anomalies(
+            entries, data.get("message_counter")
+        )
         anomalies.extend(pattern_anomalies)
 
         # Check for timing anomalies
-        timing_anomalies = self._detect_timing_anomalies(entries)
+        timing_anomalies = self._detect_timing_anomalies(entries, data.get("gaps"))
         anomalies.extend(timing_anomalies)
 
         return anomalies
 
-    def _get_level_distribution(self, entries: List[LogEntry]) -> Dict[str, int]:
-        """Get distribution of log levels"""
-        distribution = Counter(e.level for e in entries)
-        return dict(distribution)
+    def _entry_data(self, entries: Entries, with_mask: bool = False) -> Dict[str, Any]:
+        """
+        Per-entry data shared by the metrics and the detectors
 
-    def _calculate_error_rate(self, entries: List[LogEntry]) -> float:
-        """Calculate percentage of error/warning logs"""
-        if not entries:
-            return 0.0
+        Args:
+            entries: List of LogEntry objects or columnar LogEntries
+            with_mask: Also return the hard-error mask used by spike detection
+        """
+        level_counter, error_counter, lengths, message_counter, is_error = (
+            self._collect(entries, with_mask)
+        )
+        data = {
+            "level_counter": level_counter,
+            "error_counter": error_counter,
+            "lengths": lengths,
+            "message_counter": message_counter,
+            "gaps": self._calculate_time_gaps(entries),
+        }
+        if is_error is not None:
+            data["is_error"] = is_error
+        return data
 
-        error_count = sum(
-            1 for e in entries if e.level in ["ERROR", "CRITICAL", "WARNING"]
+    def _collect(
+        self, entries: Entries, with_mask: bool = False
+    ) -> Tuple[Counter, Counter, np.ndarray, Counter, Optional[np.ndarray]]:
+        """
+        Gather per-entry data for metrics in a single pass
+
+        Returns:
+            Level counts, error message counts, message lengths, counts of
+            every message and the hard-error mask (None for entry lists
+            unless with_mask is set)
+        """
+        if isinstance(entries, LogEntries):
+            counts = np.bincount(entries.levels, minlength=len(entries.level_names))
+            level_counter = Counter(
+                {name: int(c) for name, c in zip(entries.level_names, counts) if c}
+            )
+            is_error = _level_mask(entries, _HARD_ERRORS)
+            return (
+                level_counter,
+                Counter(compress(entries.messages, is_error.tolist())),
+                entries.lengths,
+                Counter(entries.messages),
+                is_error,
+            )
+
+        level_counter = Counter()
+        error_counter = Counter()
+        message_counter = Counter()
+        flags = [] if with_mask else None
+
+        for e in entries:
+            message = e.message
+            level_counter[e.level] += 1
+            is_hard_error = e.level in _HARD_ERRORS
+            if is_hard_error:
+                error_counter[message] += 1
+            if flags is not None:
+                flags.append(is_hard_error)
+            message_counter[message] += 1
+
+        lengths = np.fromiter(
+            (len(e.message) for e in entries), dtype=np.int32, count=len(entries)
         )
-        return (error_count / len(entries)) * 100
+        is_error = np.array(flags, dtype=bool) if flags is not None else None
+        return level_counter, error_counter, lengths, message_counter, is_error
 
-    def _get_message_length_stats(self, entries: List[LogEntry]) -> Dict[str, float]:
+    def _get_message_length_stats(self, lengths: np.ndarray) -> Dict[str, float]:
         """Get statistics on message lengths"""
-        if not entries:
+        if not lengths.size:
             return {}
 
-        lengths = [len(e.message) for e in entries]
+        mean, std = _mean_std(lengths)
         return {
-            "mean": float(np.mean(lengths)),
-            "std": float(np.std(lengths)),
-            "min": float(np.min(lengths)),
-            "max": float(np.max(lengths)),
+            "mean": mean,
+            "std": std,
+            "min": float(lengths.min()),
+            "max": float(lengths.max()),
         }
 
-    def _calculate_time_gaps(self, entries: List[LogEntry]) -> List[float]:
+    def _calculate_time_gaps(self, entries: Entries) -> np.ndarray:
         """Calculate time gaps between consecutive log entries (in seconds)"""
-        gaps = []
-        for i in range(1, len(entries)):
-            prev_time = entries[i - 1].timestamp
-            curr_time = entries[i].timestamp
-            gap = (curr_time - prev_time).total_seconds()
-            gaps.append(gap)
-
-        return gaps
-
-    def _get_top_errors(
-        self, entries: List[LogEntry], top_n: int = 5
-    ) -> List[Tuple[str, int]]:
-        """Get most common error messages"""
-        error_entries = [e for e in entries if e.level in ["ERROR", "CRITICAL"]]
-        error_counter = Counter(e.message for e in error_entries)
-        return error_counter.most_common(top_n)
-
-    def _detect_error_spikes(self, entries: List[LogEntry]) -> List[Dict[str, Any]]:
+        # Microseconds / 1e6 rounds exactly like timedelta.total_seconds()
+        return np.diff(_timestamps(entries)).astype(np.int64) / 1e6
+
+    def _detect_error_spikes(
+        self, entries: Entries, is_error: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """Detect sudden increases in error frequency"""
         anomalies = []
 
-        # Split entries into chunks of 100
-        chunk_size = max(10, len(entries) // 10)
-        chunks = [
-            entries[i : i + chunk_size] for i in range(0, len(entries), chunk_size)
-        ]
-
-        error_rates = []
-        for chunk in chunks:
-            error_count = sum(1 for e in chunk if e.level in ["ERROR", "CRITICAL"])
-            rate = (error_count / len(chunk)) * 100 if chunk else 0
-            error_rates.append(rate)
-
-        # Calculate mean and std of error rates
-        if len(error_rates) > 1:
-            mean_rate = np.mean(error_rates)
-            std_rate = np.std(error_rates)
-
-            for i, rate in enumerate(error_rates):
-                if rate > mean_rate + (self.threshold * std_rate):
-                    chunk = chunks[i]
-                    anomalies.append(
-                        {
-                            "type": "error_spike",
-                            "severity": (
-                                "high"
-                                if rate > mean_rate + (2 * std_rate)
-                                else "medium"
-                            ),
-                            "description": f"Error spike detected: {rate:.1f}% error rate (baseline: {mean_rate:.1f}%)",
-                            "chunk_start": chunk[0].timestamp if chunk else None,
-                            "chunk_end": chunk[-1].timestamp if chunk else None,
-                            "affected_entries": len(chunk),
-                        }
-                    )
+        # Split entries into ~10 chunks and compare their error rates
+        n = len(entries)
+        chunk_size = max(10, n // 10)
+        if is_error is None:
+            is_error = _level_mask(entries, _HARD_ERRORS)
+        is_error = is_error.astype(np.int8)
+        error_rates, spike_indices = _spike_kernel(is_error, chunk_size, self.threshold)
+
+        if len(spike_indices):
+            mean_rate = error_rates.mean()
+            std_rate = error_rates.std()
+
+            for i in spike_indices.tolist():
+                rate = error_rates[i]
+                start = i * chunk_size
+                end = min(start + chunk_size, n)
+                anomalies.append(
+                    {
+                        "type": "error_spike",
+                        "severity": (
+                            "high" if rate > mean_rate + (2 * std_rate) else "medium"
+                        ),
+                        "description": f"Error spike detected: {rate:.1f}% error rate (baseline: {mean_rate:.1f}%)",
+                        "chunk_start": _timestamp_at(entries, start),
+                        "chunk_end": _timestamp_at(entries, end - 1),
+                        "affected_entries": end - start,
+                    }
+                )
 
         return anomalies
 
     def _detect_pattern_anomalies(
-        self, entries: List[LogEntry]
+        self, entries: Entries, message_counter: Optional[Counter] = None
     ) -> List[Dict[str, Any]]:
         """Detect unusual patterns in messages"""
         anomalies = []
 
-        message_counter = Counter(e.message for e in entries)
+        if message_counter is None:
+            message_counter = Counter(_messages(entries))
         total_entries = len(entries)
+        if not message_counter:
+            return anomalies
 
-        # Find messages that appear very frequently or very rarely
-        for message, count in message_counter.most_common(20):
-            percentage = (count / total_entries) * 100
+        messages = list(message_counter)
+        counts = np.fromiter(
+            message_counter.values(), dtype=np.int64, count=len(messages)
+        )
 
-            # Flag messages appearing in >30% of logs or very rare
-            if percentage > 30 or (count == 1 and total_entries > 100):
-                anomalies.append(
-                    {
-                        "type": "pattern_anomaly",
-                        "severity": "high" if percentage > 50 else "medium",
-                        "message": message[:100],
-                        "occurrence_count": count,
-                        "percentage": percentage,
-                    }
-                )
+        # Among the 20 most common messages, flag those appearing in >30% of
+        # logs or very rare
+        top = _top_k(counts, 20)
+        top_counts = counts[top]
+        percentages = (top_counts / total_entries) * 100
+        flagged = (percentages > 30) | ((top_counts == 1) & (total_entries > 100))
+
+        for i in np.flatnonzero(flagged).tolist():
+            message = messages[top[i]]
+            count = int(top_counts[i])
+            percentage = float(percentages[i])
+            anomalies.append(
+                {
+                    "type": "pattern_anomaly",
+                    "severity": "high" if percentage > 50 else "medium",
+                    "message": message[:100],
+                    "occurrence_count": count,
+                    "percentage": percentage,
+                }
+            )
 
         return anomalies
 
-    def _detect_timing_anomalies(self, entries: List[LogEntry]) -> List[Dict[str, Any]]:
+    def _detect_timing_anomalies(
+        self, entries: Entries, gaps: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
         """Detect unusual timing patterns"""
         anomalies = []
 
-        gaps = self._calculate_time_gaps(entries)
-        if not gaps:
+        if gaps is None:
+            gaps = self._calculate_time_gaps(entries)
+        # A single gap is its own mean, and no gap can lie more than
+        # sqrt(n - 1) standard deviations above the mean of n gaps
+        if gaps.size < 2 or (0 <= self.threshold and gaps.size - 1 < self.threshold**2):
             return anomalies
 
-        gaps = np.array(gaps)
-        mean_gap = np.mean(gaps)
-        std_gap = np.std(gaps)
-
-        # Find unusually large gaps
-        for i, gap in enumerate(gaps):
-            if gap > mean_gap + (self.threshold * std_gap):
-                anomalies.append(
-                    {
-                        "type": "timing_anomaly",
-                        "severity": "medium",
-                        "description": f"Unusual gap between logs: {gap:.2f}s (baseline: {mean_gap:.2f}s)",
-                        "gap_duration": gap,
-                        "entry_index": i,
-                    }
-                )
+        mean_gap, std_gap = _mean_std(gaps)
+        cutoff = mean_gap + (self.threshold * std_gap)
+
+        # Find unusually large gaps (uniform-rate logs usually have none)
+        for i in np.flatnonzero(gaps > cutoff).tolist():
+            gap = gaps[i]
+            anomalies.append(
+                {
+                    "type": "timing_anomaly",
+                    "severity": "medium",
+                    "description": f"Unusual gap between logs: {gap:.2f}s (baseline: {mean_gap:.2f}s)",
+                    "gap_duration": gap,
+                    "entry_index": i,
+                }
+            )
 
         return anomalies
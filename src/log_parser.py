@@ -3,11 +3,62 @@ Log Parser Module
 Handles parsing and normalization of log files
 """
 
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+def _collect_hyperscan_match(pattern_id, start, end, flags, hits):
+    """Hyperscan match callback recording (start, pattern id, end)"""
+    hits.append((start, pattern_id, end))
+
+
+# Bytes decoded per batch when reading log files
+READ_BLOCK_SIZE = 1 << 22
+
+
+def _iter_lines(buffer, start: int = 0, end: Optional[int] = None):
+    """
+    Yield decoded lines from a bytes-like buffer (e.g. an mmap)
+
+    The buffer is decoded in blocks of about READ_BLOCK_SIZE bytes, each cut
+    at a newline so no line or UTF-8 sequence is split. Like text-mode
+    reads, "\r\n" and a lone "\r" also end lines. Undecodable bytes are
+    replaced rather than aborting the read.
+
+    Args:
+        buffer: bytes or mmap supporting find/rfind and slicing
+        start: Offset of the first byte to read
+        end: Offset to stop at (defaults to the end of the buffer)
+    """
+    end = len(buffer) if end is None else end
+    pos = start
+    while pos < end:
+        block_end = min(pos + READ_BLOCK_SIZE, end)
+        if block_end < end:
+            newline = buffer.rfind(b"\n", pos, block_end)
+            if newline == -1:
+                newline = buffer.find(b"\n", block_end, end)
+            block_end = end if newline == -1 else newline + 1
+
+        text = buffer[pos:block_end].decode("utf-8", "replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        yield from text.split("\n")
+        pos = block_end
+
 
 @dataclass
 class LogEntry:
@@ -33,6 +84,116 @@ class LogEntry:
         }
 
 
+class LogEntries:
+    """
+    Columnar (structure-of-arrays) storage for parsed log entries
+
+    Timestamps, level codes and message lengths live in NumPy arrays so
+    metrics can be computed as vectorized reductions; messages and sources
+    stay Python lists. Arrays grow by doubling as entries are appended.
+    """
+
+    # Canonical levels get fixed codes; other level names are added on demand
+    LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize empty columns
+
+        Args:
+            capacity: Initial number of rows to allocate
+        """
+        capacity = max(1, capacity)
+        self._timestamps = np.empty(capacity, dtype="datetime64[us]")
+        self._levels = np.empty(capacity, dtype=np.int8)
+        self._lengths = np.empty(capacity, dtype=np.int32)
+        self.messages: List[str] = []
+        self.sources: List[str] = []
+        self.level_names: List[str] = list(self.LEVELS)
+        self._level_codes = {name: code for code, name in enumerate(self.LEVELS)}
+        self._size = 0
+
+    @classmethod
+    def from_entries(cls, entries: List[LogEntry]) -> "LogEntries":
+        """Build columns from a list of LogEntry objects"""
+        n = len(entries)
+        columns = cls(capacity=n)
+        # Fill each array in one pass with its size known up front
+        columns._timestamps[:n] = np.fromiter(
+            (e.timestamp for e in entries), dtype="datetime64[us]", count=n
+        )
+        columns._levels[:n] = np.fromiter(
+            (columns.level_code(e.level) for e in entries), dtype=np.int8, count=n
+        )
+        columns._lengths[:n] = np.fromiter(
+            (len(e.message) for e in entries), dtype=np.int32, count=n
+        )
+        columns.messages = [e.message for e in entries]
+        columns.sources = [e.source for e in entries]
+        columns._size = n
+        return columns
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self._size]
+
+    @property
+    def levels(self) -> np.ndarray:
+        return self._levels[: self._size]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self._lengths[: self._size]
+
+    def level_code(self, level: str) -> int:
+        """Return the code for a level name, registering new names"""
+        code = self._level_codes.get(level)
+        if code is None:
+            code = len(self.level_names)
+            if code > np.iinfo(np.int8).max:
+                raise ValueError("Too many distinct log levels")
+            self.level_names.append(level)
+            self._level_codes[level] = code
+        return code
+
+    def level_codes(self, levels) -> np.ndarray:
+        """Codes of the given level names that occur in these entries"""
+        return np.array(
+            [
+                self._level_codes[level]
+                for level in levels
+                if level in self._level_codes
+            ],
+            dtype=np.int8,
+        )
+
+    def append(
+        self, timestamp: datetime, level: str, message: str, source: str = ""
+    ) -> None:
+        """Append one entry, growing the arrays when full"""
+        i = self._size
+        if i == len(self._levels):
+            self._grow()
+        self._timestamps[i] = timestamp
+        self._levels[i] = self.level_code(level)
+        self._lengths[i] = len(message)
+        self.messages.append(message)
+        self.sources.append(source)
+        self._size = i + 1
+
+    def _grow(self) -> None:
+        """Double the capacity of the array columns"""
+        capacity = 2 * len(self._levels)
+        for name in ("_timestamps", "_levels", "_lengths"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+
 class LogParser:
     """Parse and normalize logs from various formats"""
 
@@ -45,43 +206,187 @@ class LogParser:
         "level": r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|WARN|ERR)\b",
     }
 
+    # Patterns matched by the per-line scan, in priority order
+    SCAN_PATTERNS = (
+        ("iso", r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"),
+        ("std", r"\d{4}-\d{2}-\d{2}\s\d{2}:\d{2}:\d{2}"),
+        ("lvl", r"\b(?:DEBUG|INFO|WARNING|ERROR|CRITICAL|WARN|ERR)\b"),
+    )
+
+    # Files smaller than this are not worth spreading across processes
+    PARALLEL_MIN_BYTES = 1 << 20
+
+    # Level aliases normalized to their canonical names
+    LEVEL_ALIASES = {
+        "WARN": "WARNING",
+        "ERR": "ERROR",
+    }
+
     def __init__(self):
         """Initialize the log parser"""
         self.compiled_patterns = {
             name: re.compile(pattern) for name, pattern in self.PATTERNS.items()
         }
+        # Timestamps and levels found in a single left-to-right scan per line
+        self._combined = re.compile(
+            "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in self.SCAN_PATTERNS)
+        )
+        self._hs_db = self._compile_hyperscan() if hyperscan is not None else None
+        # Matched level words mapped to shared, canonical level strings
+        self._level_intern = {
+            word: sys.intern(self.LEVEL_ALIASES.get(word, word))
+            for word in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "WARN", "ERR")
+        }
+        # Metadata patterns, compiled once rather than on every line
+        self._ip_re = re.compile(r"(?:\d{1,3}\.){3}\d{1,3}")
+        self._status_re = re.compile(r"(?:HTTP/[\d.]+\s+)?(\d{3})\s")
+        self._error_code_re = re.compile(
+            r"(?:error|code|errno)\s*:?\s*([A-Z0-9_]+|\d+)", re.IGNORECASE
+        )
 
-    def parse_file(self, file_path: str) -> List[LogEntry]:
+    def parse_file(
+        self,
+        file_path: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        default_ts: Optional[datetime] = None,
+    ) -> List[LogEntry]:
         """
         Parse a log file and return list of LogEntry objects
 
         Args:
             file_path: Path to the log file
+            start: Byte offset to start parsing at (must begin a line)
+            end: Byte offset to stop at (defaults to end of file)
+            default_ts: Timestamp for lines without one (defaults to now)
 
         Returns:
             List of parsed LogEntry objects
         """
         entries = []
+        # Lines without a timestamp all share the time parsing started
+        if default_ts is None:
+            default_ts = datetime.now()
+        # Repeated messages share one string object
+        msg_pool: Dict[str, str] = {}
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        entry = self.parse_line(line)
-                        if entry:
-                            entries.append(entry)
+            for line in self._read_lines(file_path, start, end):
+                entry = self.parse_line(line, default_ts)
+                if entry:
+                    entry.message = msg_pool.setdefault(entry.message, entry.message)
+                    entries.append(entry)
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
             return entries
 
         return entries
 
-    def parse_line(self, line: str) -> Optional[LogEntry]:
+    def parse_file_columnar(self, file_path: str) -> LogEntries:
+        """
+        Parse a log file into columnar LogEntries
+
+        Args:
+            file_path: Path to the log file
+
+        Returns:
+            LogEntries holding the parsed timestamps, levels and messages
+        """
+        columns = LogEntries()
+        default_ts = datetime.now()
+        msg_pool: Dict[str, str] = {}
+        try:
+            for line in self._read_lines(file_path):
+                timestamp, level, message = self._parse_fields(line, default_ts)
+                message = msg_pool.setdefault(message, message)
+                columns.append(timestamp, level, message)
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+
+        return columns
+
+    def parse_file_parallel(
+        self, file_path: str, workers: Optional[int] = None
+    ) -> List[LogEntry]:
+        """
+        Parse a log file across several worker processes
+
+        The file is split into byte ranges aligned on line boundaries, each
+        parsed by its own process; results keep the file's line order.
+        Small files are parsed in-process.
+
+        Args:
+            file_path: Path to the log file
+            workers: Number of processes (defaults to the CPU count)
+
+        Returns:
+            List of parsed LogEntry objects
+        """
+        workers = workers or os.cpu_count() or 1
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            print(f"Error reading file {file_path}: {e}")
+            return []
+
+        if workers <= 1 or size < self.PARALLEL_MIN_BYTES:
+            return self.parse_file(file_path)
+
+        # Taken once here so every range uses the same default timestamp
+        default_ts = datetime.now()
+        ranges = self._split_file(file_path, size, workers)
+        entries = []
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(_parse_file_range, file_path, start, end, default_ts)
+                for start, end in ranges
+            ]
+            for future in futures:
+                entries.extend(future.result())
+
+        return entries
+
+    @staticmethod
+    def _read_lines(file_path: str, start: int = 0, end: Optional[int] = None):
+        """Yield the stripped, non-empty lines of a file (or a byte range)"""
+        with open(file_path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and pipes cannot be memory-mapped
+                buffer = f.read()
+
+            try:
+                for line in _iter_lines(buffer, start, end):
+                    line = line.strip()
+                    if line:
+                        yield line
+            finally:
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+
+    @staticmethod
+    def _split_file(file_path: str, size: int, parts: int) -> List[Tuple[int, int]]:
+        """Split a file into about `parts` byte ranges that start on new lines"""
+        offsets = [0]
+        with open(file_path, "rb") as f:
+            for i in range(1, parts):
+                f.seek(size * i // parts)
+                f.readline()  # advance to the start of the next line
+                offset = f.tell()
+                if offsets[-1] < offset < size:
+                    offsets.append(offset)
+        offsets.append(size)
+        return list(zip(offsets, offsets[1:]))
+
+    def parse_line(
+        self, line: str, default_ts: Optional[datetime] = None
+    ) -> Optional[LogEntry]:
         """
         Parse a single log line
 
         Args:
             line: Single log line
+            default_ts: Timestamp for lines without one (defaults to now)
 
         Returns:
             LogEntry object or None if parsing fails
@@ -89,18 +394,7 @@ class LogParser:
         if not line:
             return None
 
-        # Extract timestamp
-        timestamp = self._extract_timestamp(line)
-        if not timestamp:
-            timestamp = datetime.now()
-
-        # Extract log level
-        level = self._extract_level(line)
-        if not level:
-            level = "INFO"
-
-        # Extract message (everything after the level indicator)
-        message = self._extract_message(line, level)
+        timestamp, level, message = self._parse_fields(line, default_ts)
 
         # Create metadata
         metadata = self._extract_metadata(line)
@@ -113,53 +407,122 @@ class LogParser:
             raw_line=line,
         )
 
-    def _extract_timestamp(self, line: str) -> Optional[datetime]:
-        """Extract timestamp from log line"""
-        for pattern_name in ["iso8601", "standard", "timestamp"]:
-            pattern = self.compiled_patterns[pattern_name]
-            match = pattern.search(line)
-            if match:
+    def _parse_fields(
+        self, line: str, default_ts: Optional[datetime] = None
+    ) -> Tuple[datetime, str, str]:
+        """Extract timestamp, level and message from a non-empty line"""
+        # Single scan for timestamps and level; their spans are cut from
+        # the message
+        iso = std = level = None
+        spans = []
+        for kind, start, end in self._scan(line):
+            if kind == "lvl":
+                if level is None:
+                    level = line[start:end]
+            elif kind == "iso":
+                if iso is None:
+                    iso = line[start:end]
+            elif std is None:
+                std = line[start:end]
+            spans.append((start, end))
+
+        # Extract timestamp
+        timestamp = self._extract_timestamp(line, iso, std)
+        if not timestamp:
+            timestamp = default_ts or datetime.now()
+
+        # Extract log level
+        level = self._extract_level(level) if level else "INFO"
+
+        # Extract message (the line without timestamps and level indicators)
+        message = self._extract_message(line, spans)
+
+        return timestamp, level, message
+
+    def _compile_hyperscan(self):
+        """Compile SCAN_PATTERNS into a Hyperscan database"""
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode() for _, pattern in self.SCAN_PATTERNS],
+            ids=list(range(len(self.SCAN_PATTERNS))),
+            elements=len(self.SCAN_PATTERNS),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(self.SCAN_PATTERNS),
+        )
+        return db
+
+    def _scan(self, line: str) -> List[Tuple[str, int, int]]:
+        """
+        Find non-overlapping timestamp/level matches in a line
+
+        Returns:
+            (kind, start, end) tuples from left to right, where kind is a
+            SCAN_PATTERNS name
+        """
+        # Hyperscan reports byte offsets, which equal str offsets only for ASCII
+        if self._hs_db is None or not line.isascii():
+            return [
+                (m.lastgroup, m.start(), m.end()) for m in self._combined.finditer(line)
+            ]
+
+        hits = []
+        self._hs_db.scan(
+            line.encode("ascii"),
+            match_event_handler=_collect_hyperscan_match,
+            context=hits,
+        )
+
+        # Keep the leftmost match at each position, like re.finditer does
+        hits.sort()
+        matches = []
+        pos = 0
+        for start, pattern_id, end in hits:
+            if start >= pos:
+                matches.append((self.SCAN_PATTERNS[pattern_id][0], start, end))
+                pos = end
+        return matches
+
+    def _extract_timestamp(
+        self, line: str, iso: Optional[str], std: Optional[str]
+    ) -> Optional[datetime]:
+        """Parse the scanned ISO/standard timestamp, else a Unix timestamp"""
+        # The scan fixes the layout, so the C ISO parser handles both kinds
+        # (fromisoformat accepts any separator between date and time)
+        for timestamp_str in (iso, std):
+            if timestamp_str:
                 try:
-                    timestamp_str = match.group(1)
-                    if pattern_name == "timestamp":
-                        # Unix timestamp
-                        return datetime.fromtimestamp(int(timestamp_str) / 1000)
-                    else:
-                        # Parse ISO or standard format
-                        for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]:
-                            try:
-                                return datetime.strptime(timestamp_str, fmt)
-                            except ValueError:
-                                continue
-                except Exception:
+                    return datetime.fromisoformat(timestamp_str)
+                except ValueError:
                     continue
-        return None
 
-    def _extract_level(self, line: str) -> Optional[str]:
-        """Extract log level from line"""
-        pattern = self.compiled_patterns["level"]
-        match = pattern.search(line)
+        match = self.compiled_patterns["timestamp"].search(line)
         if match:
-            level = match.group(1).upper()
-            # Normalize levels
-            level_map = {
-                "WARN": "WARNING",
-                "ERR": "ERROR",
-            }
-            return level_map.get(level, level)
+            try:
+                # Unix timestamp
+                return datetime.fromtimestamp(int(match.group(1)) / 1000)
+            except Exception:
+                pass
         return None
 
-    def _extract_message(self, line: str, level: str) -> str:
-        """Extract message from log line"""
-        # Remove timestamp and level from the line
-        message = line
-        message = re.sub(self.PATTERNS["iso8601"], "", message)
-        message = re.sub(self.PATTERNS["standard"], "", message)
-        message = re.sub(self.PATTERNS["level"], "", message)
-
-        # Clean up extra whitespace and brackets
-        message = re.sub(r"^\s*[\[\-:]*\s*", "", message)
-        message = message.strip()
+    def _extract_level(self, level: str) -> str:
+        """Normalize a matched log level"""
+        canonical = self._level_intern.get(level)
+        if canonical is None:
+            level = level.upper()
+            canonical = self.LEVEL_ALIASES.get(level, level)
+        return canonical
+
+    def _extract_message(self, line: str, spans: List[Tuple[int, int]]) -> str:
+        """Extract message by cutting the matched spans out of the line"""
+        pieces = []
+        pos = 0
+        for start, end in spans:
+            pieces.append(line[pos:start])
+            pos = end
+        pieces.append(line[pos:])
+        message = "".join(pieces)
+
+        # Clean up extra whitespace and leading brackets/separators
+        message = message.lstrip().lstrip("[-:").strip()
 
         return message[:500]  # Limit message length
 
@@ -169,21 +532,25 @@ class LogParser:
 
         # Extract common fields
         # IP addresses
-        ip_pattern = r"(?:\d{1,3}\.){3}\d{1,3}"
-        ip_matches = re.findall(ip_pattern, line)
+        ip_matches = self._ip_re.findall(line)
         if ip_matches:
             metadata["ips"] = ip_matches
 
-        # HTTP status codes
-        status_pattern = r"(?:HTTP/[\d.]+\s+)?(\d{3})\s"
-        status_matches = re.findall(status_pattern, line)
-        if status_matches:
-            metadata["http_status"] = status_matches[0]
+        # HTTP status codes (only the first one is kept)
+        status_match = self._status_re.search(line)
+        if status_match:
+            metadata["http_status"] = status_match.group(1)
 
         # Error codes
-        error_pattern = r"(?:error|code|errno)\s*:?\s*([A-Z0-9_]+|\d+)"
-        error_matches = re.findall(error_pattern, line, re.IGNORECASE)
+        error_matches = self._error_code_re.findall(line)
         if error_matches:
             metadata["error_codes"] = error_matches
 
         return metadata
+
+
+def _parse_file_range(
+    file_path: str, start: int, end: int, default_ts: datetime
+) -> List[LogEntry]:
+    """Worker for LogParser.parse_file_parallel"""
+    return LogParser().parse_file(file_path, start, end, default_ts)
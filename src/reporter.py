@@ -3,14 +3,42 @@ Reporter Module
 Handles report generation and formatting
 """
 
+import io
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TextIO
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Datetimes are passed to default=str so they render as with json.dumps
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
 
 class Reporter:
     """Generate reports in various formats"""
 
+    # Maximum number of log entries embedded in a report
+    MAX_REPORT_LOGS = 100
+
     def __init__(self):
         """Initialize reporter"""
         self.timestamp = datetime.now().isoformat()
@@ -19,24 +47,35 @@ class Reporter:
         """Convert analysis to dictionary"""
         return {
             "timestamp": self.timestamp,
-            "data": data,
+            "data": self._with_serialized_logs(data),
         }
 
     def to_json(self, data: Dict[str, Any]) -> str:
         """Convert analysis to JSON string"""
         report_data = {
             "timestamp": self.timestamp,
-            "analysis": data,
+            "analysis": self._with_serialized_logs(data),
         }
-        return json.dumps(report_data, indent=2, default=str)
+        return _dump_json(report_data).decode("utf-8")
+
+    def to_html(
+        self, data: Dict[str, Any], out: Optional[TextIO] = None
+    ) -> Optional[str]:
+        """
+        Convert analysis to HTML report
+
+        Args:
+            data: Report data
+            out: Optional text stream to write the HTML to
 
-    def to_html(self, data: Dict[str, Any]) -> str:
-        """Convert analysis to HTML report"""
+        Returns:
+            The HTML string, or None when it was written to `out`
+        """
         metrics = data.get("metrics", {})
         anomalies = data.get("anomalies", [])
-        logs = data.get("logs", [])
+        buffer = io.StringIO() if out is None else out
 
-        html = f"""
+        buffer.write(f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -131,35 +170,39 @@ class Reporter:
                 <th>Level</th>
                 <th>Count</th>
             </tr>
-"""
+""")
 
-        for level, count in metrics.get("level_distribution", {}).items():
-            html += f"<tr><td>{level}</td><td>{count}</td></tr>"
+        buffer.write(
+            "".join(
+                f"<tr><td>{level}</td><td>{count}</td></tr>"
+                for level, count in metrics.get("level_distribution", {}).items()
+            )
+        )
 
-        html += f"""
+        buffer.write("""
         </table>
 
         <h2>Detected Anomalies</h2>
-"""
+""")
 
         if anomalies:
             for anomaly in anomalies:
                 severity = anomaly.get("severity", "low")
-                html += f"""
+                buffer.write(f"""
         <div class="anomaly severity-{severity}">
             <strong>{anomaly.get('type', 'Unknown')}</strong> (Severity: {severity})<br>
             {anomaly.get('description', anomaly.get('message', 'N/A'))}
         </div>
-"""
+""")
         else:
-            html += "<p>No anomalies detected.</p>"
+            buffer.write("<p>No anomalies detected.</p>")
 
-        html += """
+        buffer.write("""
     </div>
 </body>
 </html>
-"""
-        return html
+""")
+        return buffer.getvalue() if out is None else None
 
     def save_report(self, report: Any, file_path: str, format: str = "json") -> None:
         """
@@ -171,12 +214,15 @@ class Reporter:
             format: Format to save in ('json' or 'html')
         """
         try:
+            if format == "json" and not isinstance(report, str):
+                with open(file_path, "wb") as f:
+                    f.write(_dump_json(self._with_serialized_logs(report)))
+                print(f"Report saved to {file_path}")
+                return
+
             with open(file_path, "w", encoding="utf-8") as f:
                 if format == "json":
-                    if isinstance(report, str):
-                        f.write(report)
-                    else:
-                        f.write(json.dumps(report, indent=2, default=str))
+                    f.write(report)
                 elif format == "html":
                     f.write(report)
                 else:
@@ -186,6 +232,21 @@ class Reporter:
         except Exception as e:
             print(f"Error saving report: {e}")
 
+    @classmethod
+    def _with_serialized_logs(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of report data with its "logs" (if any) serialized"""
+        if "logs" in data:
+            data = {**data, "logs": cls._serialize_logs(data["logs"])}
+        return data
+
+    @classmethod
+    def _serialize_logs(cls, logs: List[Any]) -> List[Dict[str, Any]]:
+        """Convert the first MAX_REPORT_LOGS entries to dictionaries"""
+        return [
+            log.to_dict() if hasattr(log, "to_dict") else log
+            for log in logs[: cls.MAX_REPORT_LOGS]
+        ]
+
     @staticmethod
     def format_timestamp(timestamp: Any) -> str:
         """Format timestamp for display"""
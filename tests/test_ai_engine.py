@@ -0,0 +1,191 @@
+"""
+Unit tests for AI Engine
+"""
+
+import unittest
+import hashlib
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+from src.ai_engine import AIEngine
+
+
+class StubCompletions:
+    """Stand-in for client.chat.completions that counts calls"""
+
+    def __init__(self, content: str = "Check the database"):
+        self.content = content
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestAIEngineCache(unittest.TestCase):
+    """Test cases for the on-disk OpenAI response cache"""
+
+    def setUp(self):
+        """Set up an engine with a stub client and a temporary cache"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.engine = self._make_engine()
+        self.anomalies = [
+            {"type": "error_spike", "severity": "high", "affected_entries": 10}
+        ]
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.tmp_dir.cleanup()
+
+    def _make_engine(self, model: str = "gpt-3.5-turbo") -> AIEngine:
+        """Helper to build an engine whose client is a stub"""
+        engine = AIEngine(api_key="", model=model, cache_dir=self.tmp_dir.name)
+        engine.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=StubCompletions())
+        )
+        return engine
+
+    def _calls(self, engine: AIEngine) -> int:
+        return engine.client.chat.completions.calls
+
+    def test_miss_writes_hashed_file(self):
+        """Test a miss calls the client and stores <sha256>.json"""
+        result = self.engine.analyze_and_suggest(self.anomalies)
+
+        self.assertEqual(result["method"], "openai")
+        self.assertEqual(self._calls(self.engine), 1)
+        files = os.listdir(self.tmp_dir.name)
+        self.assertEqual(len(files), 1)
+        name, ext = os.path.splitext(files[0])
+        self.assertEqual(ext, ".json")
+        self.assertEqual(len(name), hashlib.sha256().digest_size * 2)
+
+    def test_hit_skips_client(self):
+        """Test a cached response is returned without calling the client"""
+        first = self.engine.analyze_and_suggest(self.anomalies)
+
+        engine = self._make_engine()
+        second = engine.analyze_and_suggest(self.anomalies)
+
+        self.assertEqual(second, first)
+        self.assertEqual(self._calls(engine), 0)
+
+    def test_root_cause_hit_updates_log_count(self):
+        """Test a root-cause hit reports the current number of logs"""
+        logs = [f"ERROR timeout {i}" for i in range(10)]
+        self.engine.get_root_cause_analysis(logs)
+
+        # Same first 10 logs, so the same key, but more logs in total
+        result = self.engine.get_root_cause_analysis(logs + ["ERROR extra"])
+
+        self.assertEqual(self._calls(self.engine), 1)
+        self.assertEqual(result["log_count"], 11)
+
+    def test_key_depends_on_model(self):
+        """Test changing the model misses the cache"""
+        self.engine.analyze_and_suggest(self.anomalies)
+
+        engine = self._make_engine(model="gpt-4")
+        engine.analyze_and_suggest(self.anomalies)
+
+        self.assertEqual(self._calls(engine), 1)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+    def test_failed_write_leaves_no_temp_file(self):
+        """Test a failed cache write cleans up its temporary file"""
+        with mock.patch("src.ai_engine.os.replace", side_effect=OSError("denied")):
+            with mock.patch("builtins.print"):
+                result = self.engine.analyze_and_suggest(self.anomalies)
+
+        self.assertEqual(result["method"], "openai")
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+def legacy_root_causes(error_logs):
+    """Causes as found by the original substring-based heuristic"""
+    error_text = " ".join(error_logs).lower()
+    keyword_groups = [
+        ("connection", "timeout", "refused"),
+        ("memory", "out of memory", "heap"),
+        ("permission", "denied", "unauthorized"),
+        ("database", "sql", "query"),
+    ]
+    causes = [
+        cause
+        for keywords, (cause, _) in zip(keyword_groups, AIEngine._ROOT_CAUSES)
+        if any(word in error_text for word in keywords)
+    ]
+    return causes or ["Requires detailed investigation"]
+
+
+class TestRootCauseHeuristic(unittest.TestCase):
+    """Test cases for the heuristic root-cause classifier"""
+
+    def setUp(self):
+        """Set up an engine without a client"""
+        self.engine = AIEngine(api_key="")
+        self.engine.client = None
+
+    def _causes(self, error_logs):
+        return self.engine.get_root_cause_analysis(error_logs)["causes"]
+
+    def test_multi_category_order_and_deduplication(self):
+        """Test causes keep category order and appear once each"""
+        logs = [
+            "SQL query failed",
+            "Permission denied for user",
+            "connection refused",
+            "database timeout",
+            "Unauthorized access",
+        ]
+        causes = self._causes(logs)
+
+        self.assertEqual(
+            causes,
+            [
+                "Network connectivity or service availability issue",
+                "Authentication or authorization failure",
+                "Database query or connection issue",
+            ],
+        )
+        self.assertEqual(causes, legacy_root_causes(logs))
+
+    def test_all_categories_stop_early(self):
+        """Test scanning stops once all four categories have matched"""
+        logs = ["timeout memory denied sql"] + ["unrelated"] * 3
+        seen = []
+
+        class RecordingList(list):
+            def __iter__(inner):
+                for log in list.__iter__(inner):
+                    seen.append(log)
+                    yield log
+
+        result = self.engine.get_root_cause_analysis(RecordingList(logs))
+
+        self.assertEqual(len(result["causes"]), 4)
+        self.assertEqual(len(result["recommendations"]), 4)
+        self.assertEqual(seen, logs[:1])
+        self.assertEqual(result["causes"], legacy_root_causes(logs))
+
+    def test_mixed_case_input(self):
+        """Test keywords match regardless of case"""
+        for logs in (["OUT OF MEMORY"], ["Heap Exhausted"], ["ConNecTion reset"]):
+            with self.subTest(logs=logs):
+                self.assertEqual(self._causes(logs), legacy_root_causes(logs))
+
+    def test_no_match_fallback(self):
+        """Test unknown errors fall back to a detailed investigation"""
+        result = self.engine.get_root_cause_analysis(["Something odd happened"])
+
+        self.assertEqual(result["causes"], ["Requires detailed investigation"])
+        self.assertEqual(
+            result["recommendations"], ["Review full error stack trace and logs"]
+        )
+        self.assertEqual(result["causes"], legacy_root_causes(["Something odd"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,11 @@ Integration tests
 """
 
 import unittest
+import json
 import os
 import tempfile
 from src.analyzer import LogAnalyzer
+from config.settings import Settings
 
 
 class TestLogAnalyzer(unittest.TestCase):
@@ -65,6 +67,48 @@ class TestLogAnalyzer(unittest.TestCase):
         self.assertIsInstance(recommendations, list)
         self.assertGreater(len(recommendations), 0)
 
+    def test_generate_json_report(self):
+        """Test JSON report output is valid and includes the parsed logs"""
+        self.analyzer.analyze_file(self.temp_log.name)
+        report = json.loads(self.analyzer.generate_report(output_format="json"))
+
+        logs = report["analysis"]["logs"]
+        self.assertEqual(len(logs), 5)
+        self.assertEqual(logs[0]["level"], "INFO")
+        self.assertEqual(
+            report["analysis"]["metrics"]["total_entries"],
+            self.analyzer.metrics["total_entries"],
+        )
+
+    def test_report_data_logs_serialized(self):
+        """Test every report output carries logs as dictionaries"""
+        self.analyzer.analyze_file(self.temp_log.name)
+        report_data = self.analyzer._get_report_data()
+        reporter = self.analyzer.reporter
+
+        logs = reporter.to_dict(report_data)["data"]["logs"]
+        self.assertEqual(len(logs), 5)
+        self.assertIsInstance(logs[0], dict)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report_file = os.path.join(tmp_dir, "report.json")
+            reporter.save_report(report_data, report_file, format="json")
+            with open(report_file) as f:
+                saved = json.load(f)
+        self.assertEqual(saved["logs"], logs)
+
+    def test_settings_passed_through(self):
+        """Test analyzer components are configured from settings"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, "settings.yaml")
+            with open(config_file, "w") as f:
+                f.write("anomaly_threshold: 3.5\nopenai:\n  model: gpt-4\n")
+
+            analyzer = LogAnalyzer(settings=Settings(config_file=config_file))
+
+        self.assertEqual(analyzer.anomaly_detector.threshold, 3.5)
+        self.assertEqual(analyzer.ai_engine.model, "gpt-4")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,15 @@ Unit tests for Anomaly Detector
 
 import unittest
 from datetime import datetime, timedelta
-from src.anomaly_detector import AnomalyDetector
-from src.log_parser import LogEntry
+from unittest import mock
+import numpy as np
+from src.anomaly_detector import (
+    AnomalyDetector,
+    SMALL_STATS_N,
+    _level_mask,
+    _mean_std,
+)
+from src.log_parser import LogEntry, LogEntries
 
 
 class TestAnomalyDetector(unittest.TestCase):
@@ -75,12 +82,105 @@ class TestAnomalyDetector(unittest.TestCase):
         entries.extend(self._create_log_entries(5, "ERROR"))
         entries.extend(self._create_log_entries(3, "WARNING"))
 
-        distribution = self.detector._get_level_distribution(entries)
+        distribution = self.detector.extract_metrics(entries)["level_distribution"]
 
         self.assertEqual(distribution["INFO"], 10)
         self.assertEqual(distribution["ERROR"], 5)
         self.assertEqual(distribution["WARNING"], 3)
 
+    def test_columnar_entries_match_list(self):
+        """Test LogEntries input gives the same metrics and anomalies"""
+        entries = []
+        entries.extend(self._create_log_entries(150, "INFO"))
+        entries.extend(self._create_log_entries(40, "ERROR"))
+        entries.extend(self._create_log_entries(10, "WARNING"))
+        columns = LogEntries.from_entries(entries)
+
+        self.assertEqual(
+            self.detector.extract_metrics(columns),
+            self.detector.extract_metrics(entries),
+        )
+        self.assertEqual(
+            self.detector.detect_anomalies(columns),
+            self.detector.detect_anomalies(entries),
+        )
+
+    def test_analyze_matches_separate_calls(self):
+        """Test analyze() gives the same results as the individual steps"""
+        entries = self._create_log_entries(150)
+        entries.extend(self._create_log_entries(30, "ERROR"))
+
+        metrics, anomalies = self.detector.analyze(entries)
+        self.assertEqual(metrics, self.detector.extract_metrics(entries))
+        self.assertEqual(anomalies, self.detector.detect_anomalies(entries))
+
+        columns = LogEntries.from_entries(entries)
+        self.assertEqual(self.detector.analyze(columns), (metrics, anomalies))
+
+    def test_error_mask_built_at_most_once(self):
+        """Test the hard-error mask is not rebuilt in a separate pass"""
+        entries = self._create_log_entries(50)
+        entries.extend(self._create_log_entries(10, "ERROR"))
+        columns = LogEntries.from_entries(entries)
+
+        with mock.patch(
+            "src.anomaly_detector._level_mask", wraps=_level_mask
+        ) as level_mask:
+            self.detector.extract_metrics(entries)
+            self.detector.analyze(entries)
+            self.assertEqual(level_mask.call_count, 0)
+
+            self.detector.analyze(columns)
+            self.assertEqual(level_mask.call_count, 1)
+
+    def test_results_follow_in_place_changes(self):
+        """Test changing entries in place is reflected in later results"""
+        entries = self._create_log_entries(20)
+        metrics = self.detector.extract_metrics(entries)
+        self.assertEqual(metrics["level_distribution"], {"INFO": 20})
+        self.detector.detect_anomalies(entries)
+
+        for entry in entries[:10]:
+            entry.level = "ERROR"
+        metrics = self.detector.extract_metrics(entries)
+        self.assertEqual(metrics["level_distribution"], {"INFO": 10, "ERROR": 10})
+
+        entries.reverse()
+        metrics, _ = self.detector.analyze(entries)
+        self.assertLess(metrics["time_gaps"][0], 0)
+
+    def test_fractional_time_gaps_exact(self):
+        """Test sub-second gaps match timedelta.total_seconds() exactly"""
+        base_time = datetime(2024, 1, 15, 10, 30, 45)
+        offsets_ms = [0, 100, 350, 1000, 1000, 2234]
+        entries = [
+            LogEntry(
+                timestamp=base_time + timedelta(milliseconds=ms),
+                level="INFO",
+                message="Tick",
+            )
+            for ms in offsets_ms
+        ]
+
+        gaps = self.detector.extract_metrics(entries)["time_gaps"]
+
+        self.assertEqual(gaps, [0.1, 0.25, 0.65, 0.0, 1.234])
+        self.assertEqual(
+            gaps,
+            [
+                (b.timestamp - a.timestamp).total_seconds()
+                for a, b in zip(entries, entries[1:])
+            ],
+        )
+
+    def test_mean_std_matches_numpy(self):
+        """Test small-input statistics agree with NumPy"""
+        for n in (1, 5, SMALL_STATS_N - 1, SMALL_STATS_N, 500):
+            values = np.random.default_rng(n).normal(100.0, 15.0, n)
+            mean, std = _mean_std(values)
+            self.assertAlmostEqual(mean, values.mean(), places=9)
+            self.assertAlmostEqual(std, values.std(), places=9)
+
 
 if __name__ == "__main__":
     unittest.main()
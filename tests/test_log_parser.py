@@ -3,7 +3,10 @@ Unit tests for Log Parser
 """
 
 import unittest
+import os
+import tempfile
 from datetime import datetime
+from typing import Iterable
 from src.log_parser import LogParser, LogEntry
 
 
@@ -13,6 +16,18 @@ class TestLogParser(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.parser = LogParser()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.tmp_dir.cleanup()
+
+    def _write_log(self, lines: Iterable[str]) -> str:
+        """Helper to write lines (with their line ends) to a temporary log"""
+        path = os.path.join(self.tmp_dir.name, "test.log")
+        with open(path, "wb") as f:
+            f.write("".join(lines).encode("utf-8"))
+        return path
 
     def test_parse_line_with_timestamp(self):
         """Test parsing a line with timestamp"""
@@ -40,6 +55,15 @@ class TestLogParser(unittest.TestCase):
         self.assertIsNotNone(entry)
         self.assertEqual(entry.level, "INFO")
 
+    def test_parse_line_default_timestamp(self):
+        """Test lines without a timestamp take the given default"""
+        default_ts = datetime(2024, 1, 1, 12, 0, 0)
+        entry = self.parser.parse_line("INFO No timestamp message", default_ts)
+        self.assertEqual(entry.timestamp, default_ts)
+
+        entry = self.parser.parse_line("2024-01-15 10:30:45 INFO Message", default_ts)
+        self.assertEqual(entry.timestamp, datetime(2024, 1, 15, 10, 30, 45))
+
     def test_metadata_extraction(self):
         """Test metadata extraction from log line"""
         line = (
@@ -51,6 +75,67 @@ class TestLogParser(unittest.TestCase):
         self.assertIn("ips", entry.metadata)
         self.assertIn("http_status", entry.metadata)
 
+    def test_parse_file_parallel_matches_parse_file(self):
+        """Test parallel parsing returns the same entries in file order"""
+        path = self._write_log(
+            f"2024-01-15 10:{i // 60:02d}:{i % 60:02d} "
+            f"{'ERROR' if i % 7 == 0 else 'INFO'} Event {i}\n"
+            for i in range(500)
+        )
+        self.parser.PARALLEL_MIN_BYTES = 0
+        sequential = self.parser.parse_file(path)
+        parallel = self.parser.parse_file_parallel(path, workers=3)
+
+        self.assertEqual(len(parallel), 500)
+        self.assertEqual(
+            [(e.timestamp, e.level, e.message) for e in parallel],
+            [(e.timestamp, e.level, e.message) for e in sequential],
+        )
+
+    def test_parse_file_parallel_shares_default_timestamp(self):
+        """Test lines without timestamps get one default across workers"""
+        path = self._write_log(
+            f"INFO Event without timestamp {i}\n" for i in range(300)
+        )
+        self.parser.PARALLEL_MIN_BYTES = 0
+        parallel = self.parser.parse_file_parallel(path, workers=3)
+
+        self.assertEqual(len(parallel), 300)
+        self.assertEqual(len({e.timestamp for e in parallel}), 1)
+
+    def test_parse_file_columnar(self):
+        """Test columnar parsing stores levels as codes"""
+        path = self._write_log(
+            [
+                "2024-01-15 10:30:45 INFO Application started\n",
+                "2024-01-15 10:30:50 ERROR Database connection failed\n",
+            ]
+        )
+        columns = self.parser.parse_file_columnar(path)
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(
+            [columns.level_names[code] for code in columns.levels], ["INFO", "ERROR"]
+        )
+        self.assertEqual(columns.messages[1], "Database connection failed")
+        self.assertEqual(
+            columns.timestamps[1].item(), datetime(2024, 1, 15, 10, 30, 50)
+        )
+
+    def test_parse_file_carriage_return_line_ends(self):
+        """Test lone \\r and \\r\\n end lines as in text-mode reads"""
+        path = self._write_log(
+            [
+                "2024-01-15 10:30:45 INFO Application started\r",
+                "2024-01-15 10:30:50 ERROR Database connection failed\r\n",
+                "2024-01-15 10:30:55 WARNING Retrying\n",
+            ]
+        )
+        entries = self.parser.parse_file(path)
+
+        self.assertEqual([e.level for e in entries], ["INFO", "ERROR", "WARNING"])
+        self.assertEqual(entries[1].message, "Database connection failed")
+
 
 if __name__ == "__main__":
     unittest.main()
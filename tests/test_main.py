@@ -0,0 +1,71 @@
+"""
+Unit tests for the command-line argument parser
+"""
+
+import unittest
+import io
+from contextlib import redirect_stderr, redirect_stdout
+from main import parse_args, build_arg_parser
+
+
+class TestParseArgs(unittest.TestCase):
+    """Test cases for parse_args"""
+
+    def _assert_matches_argparse(self, argv):
+        """Helper to compare the fast path with argparse"""
+        expected = vars(build_arg_parser().parse_args(argv))
+        self.assertEqual(vars(parse_args(argv)), expected)
+
+    def _assert_argparse_exit(self, argv, code: int = 2) -> str:
+        """Helper asserting argv exits through argparse; returns its output"""
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(output):
+            with self.assertRaises(SystemExit) as ctx:
+                parse_args(argv)
+        self.assertEqual(ctx.exception.code, code)
+        return output.getvalue()
+
+    def test_common_invocations_match_argparse(self):
+        """Test common invocations give the same namespace as argparse"""
+        invocations = [
+            ["app.log"],
+            ["app.log", "-f", "html", "-o", "report.html"],
+            ["-v", "--format", "dict", "app.log"],
+            ["app.log", "--output=out.json", "--config=custom.yaml"],
+            ["app.log", "--output=-dashed", "-c", "c.yaml", "--verbose"],
+            ["-o", "report.json", "app.log", "-v"],
+        ]
+        for argv in invocations:
+            with self.subTest(argv=argv):
+                self._assert_matches_argparse(argv)
+
+    def test_help_uses_argparse(self):
+        """Test -h prints argparse's help and exits cleanly"""
+        output = self._assert_argparse_exit(["-h"], code=0)
+        self.assertIn("usage:", output)
+
+    def test_unknown_flag_falls_back(self):
+        """Test unknown flags are reported by argparse"""
+        output = self._assert_argparse_exit(["app.log", "--bogus"])
+        self.assertIn("unrecognized arguments", output)
+
+    def test_missing_value_falls_back(self):
+        """Test a flag without its value is reported by argparse"""
+        for argv in (["app.log", "-o"], ["app.log", "-o", "-v"]):
+            with self.subTest(argv=argv):
+                output = self._assert_argparse_exit(argv)
+                self.assertIn("expected one argument", output)
+
+    def test_invalid_format_falls_back(self):
+        """Test an unknown --format is reported by argparse"""
+        output = self._assert_argparse_exit(["app.log", "--format", "xml"])
+        self.assertIn("invalid choice", output)
+
+    def test_missing_logfile_falls_back(self):
+        """Test a missing log file argument is reported by argparse"""
+        output = self._assert_argparse_exit(["-v"])
+        self.assertIn("required", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
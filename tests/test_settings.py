@@ -0,0 +1,84 @@
+"""
+Unit tests for Settings
+"""
+
+import unittest
+import json
+import os
+import tempfile
+from config.settings import Settings, CACHE_SUFFIX
+
+
+class TestSettings(unittest.TestCase):
+    """Test cases for Settings"""
+
+    def setUp(self):
+        """Set up a temporary config directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_file = os.path.join(self.tmp_dir.name, "settings.yaml")
+        self.cache_file = self.config_file + CACHE_SUFFIX
+
+    def tearDown(self):
+        """Clean up after tests"""
+        self.tmp_dir.cleanup()
+
+    def _write_config(self, text: str) -> None:
+        """Helper to write the YAML config file"""
+        with open(self.config_file, "w") as f:
+            f.write(text)
+
+    def test_cache_hit(self):
+        """Test a fresh sidecar is used instead of re-reading the YAML"""
+        self._write_config("anomaly_threshold: 3.5\n")
+        self.assertEqual(Settings(self.config_file).get("anomaly_threshold"), 3.5)
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        # Rewrite the cached payload; a hit must return it
+        with open(self.cache_file) as f:
+            cache_key = f.readline()
+        with open(self.cache_file, "w") as f:
+            f.write(cache_key + '{"anomaly_threshold": 9.0}')
+
+        self.assertEqual(Settings(self.config_file).get("anomaly_threshold"), 9.0)
+
+    def test_cache_miss_after_change(self):
+        """Test a changed config file is re-read"""
+        self._write_config("anomaly_threshold: 3.5\n")
+        Settings(self.config_file)
+
+        self._write_config("anomaly_threshold: 4.25\n")
+        self.assertEqual(Settings(self.config_file).get("anomaly_threshold"), 4.25)
+
+    def test_non_json_settings_not_cached(self):
+        """Test settings that don't survive JSON are re-read every time"""
+        self._write_config("1: a\nnull: b\n")
+
+        for _ in range(2):
+            settings = Settings(self.config_file).to_dict()
+            self.assertEqual(settings.get(1), "a")
+            self.assertEqual(settings.get(None), "b")
+            self.assertNotIn("1", settings)
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_override_does_not_change_defaults(self):
+        """Test merging a config file leaves the class defaults untouched"""
+        default_model = Settings().get("openai.model")
+        self._write_config("openai:\n  model: gpt-4\n")
+
+        self.assertEqual(Settings(self.config_file).get("openai.model"), "gpt-4")
+        self.assertEqual(Settings().get("openai.model"), default_model)
+        self.assertEqual(Settings.DEFAULT_SETTINGS["openai"]["model"], default_model)
+        self.assertNotEqual(default_model, "gpt-4")
+
+    def test_get_returns_plain_dicts(self):
+        """Test subtrees are plain dicts with or without a config file"""
+        self._write_config("openai:\n  model: gpt-4\n")
+
+        for settings in (Settings(), Settings(self.config_file)):
+            openai_settings = settings.get("openai")
+            self.assertIs(type(openai_settings), dict)
+            json.dumps(openai_settings)
+
+
+if __name__ == "__main__":
+    unittest.main()